@@ -2,6 +2,7 @@
 
 import atexit
 import logging
+import operator
 import sys
 import threading
 import time
@@ -89,7 +90,7 @@ class StreamletFlow(Celery):
             for i, conf in enumerate(self.configuration["transform"])
         ]
         # sort transforms after creation
-        self.transforms.sort(key=lambda t: t.priority, reverse=True)
+        self.transforms.sort(key=operator.attrgetter("priority"), reverse=True)
 
         logger.debug("Building outputs...")
         self.outputs: list[AbstractOutput] = [
@@ -317,7 +318,7 @@ class StreamletWorker(Worker):
             raise ValueError(f"Unknown module type: {m.__class__.__name__}")
 
         pairs: list[tuple[str, str, str]] = []
-        for t in sorted(flow.get_tasks(), key=lambda x: x.name):
+        for t in sorted(flow.get_tasks(), key=operator.attrgetter("name")):
             td = t.schedule.remaining_estimate(datetime.now(ZoneInfo(Settings.timezone)))
             next_run = td - timedelta(microseconds=td.microseconds)
 
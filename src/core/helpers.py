@@ -12,17 +12,21 @@ if typing.TYPE_CHECKING:
     from core.flow import StreamletFlow
 
 
-def flatten(mapping: dict | list, sep: str = None, chain: list = None) -> dict:
+def flatten(mapping: dict | list, sep: str = None, chain: tuple = ()) -> dict:
     """Flattens nested attribute dict on defined seperator."""
     flattened = {}
 
-    for k, v in iter(mapping.items() if isinstance(mapping, dict) else enumerate(mapping)):
-        k_chain = (chain or []) + [k]
-        if isinstance(v, (dict, list)):
-            flattened |= flatten(v, sep, k_chain)
-        else:
-            flattened[sep.join([str(k) for k in k_chain]) if sep else tuple(k_chain)] = v
+    # collect paths as tuples into one dict, strings are only joined at the leaves
+    def walk(node: dict | list, path: tuple):
+        for k, v in node.items() if isinstance(node, dict) else enumerate(node):
+            if isinstance(v, (dict, list)):
+                walk(v, (*path, k))
+            elif sep:
+                flattened[sep.join(map(str, (*path, k)))] = v
+            else:
+                flattened[(*path, k)] = v
 
+    walk(mapping, tuple(chain))
     return flattened
 
 
@@ -70,7 +70,7 @@ class Metric(MutableMapping):
         super().__setattr__(key, value)
 
     def __or__(self, other):
-        return dict(self) | other
+        return self.to_dict() | other
 
     def __ior__(self, other):
         self.attributes |= other
@@ -106,6 +106,16 @@ class Metric(MutableMapping):
         """Flattens nested attribute dict on defined seperator."""
         return flatten(mapping or self.attributes, Settings.nested_attr_seperator)
 
+    def to_dict(self) -> dict:
+        """Returns the flat dict representation, same as `dict(metric)` without per-key lookups."""
+        mapping = self.flatten()
+        if (name := self.metric_field_name) is None:
+            return mapping
+
+        # the metric takes precedence over an attribute of the same name
+        mapping.pop(name, None)
+        return {name: self.metric, **mapping}
+
     def freeze(self):
         """Freeze self."""
         self.__frozen = True
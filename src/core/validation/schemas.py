@@ -2,6 +2,7 @@
 
 # pylint: disable=R0903
 import copy
+import functools
 import math
 from string import Template
 
@@ -222,7 +223,7 @@ class TaskSchema(Schema):
 
         for i, task in enumerate(config):
             try:
-                validated = Schema(self.repeat_schema(), extra=ALLOW_EXTRA)(task)
+                validated = self.repeat_validator()(task)
 
                 # validate directly if no repeat added
                 if (for_each := validated["repeat_for"]) is None:
@@ -271,6 +272,12 @@ class TaskSchema(Schema):
 
         return {Optional("repeat_for", default=None): Maybe(check_length)}
 
+    @staticmethod
+    @functools.cache
+    def repeat_validator() -> Schema:
+        """Compiled schema for reading the repeat configuration of any task."""
+        return Schema(TaskSchema.repeat_schema(), extra=ALLOW_EXTRA)
+
 
 class KeyCount(Schema):
     """Validate weather the number of all specified keys is within a given range."""
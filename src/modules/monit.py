@@ -101,7 +101,7 @@ class MonitMetricOutput(BaseHTTPOutput):
                 "type_prefix": self.settings["monit_type_prefix"],
                 "environment": self.settings["environment"],
                 "timestamp": timestamp,
-                "data": dict(metric),
+                "data": metric.to_dict(),
                 **self.settings["static_attributes"],
             }
             for metric in data
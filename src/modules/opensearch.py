@@ -7,8 +7,11 @@ import threading
 import typing
 from urllib.parse import urlparse
 
+import orjson
 from opensearchpy import NotFoundError, OpenSearch
+from opensearchpy.exceptions import SerializationError
 from opensearchpy.helpers import bulk
+from opensearchpy.serializer import JSONSerializer
 from voluptuous import All, Any, Boolean, Coerce, Lower, Maybe, Optional, PathExists, Union
 
 from core import Settings
@@ -24,6 +27,26 @@ opensearch_logger.setLevel(level=logging.ERROR)
 opensearch_logger.propagate = False
 
 
+class ORJSONSerializer(JSONSerializer):
+    """JSON serializer for the OpenSearch client backed by orjson."""
+
+    def loads(self, s: str | bytes) -> typing.Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e) from e
+
+    def dumps(self, data: typing.Any) -> str:
+        # don't serialize strings
+        if isinstance(data, str):
+            return data
+
+        try:
+            return orjson.dumps(data, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError as e:
+            raise SerializationError(data, e) from e
+
+
 class BaseOpenSearch(AbstractModule, metaclass=abc.ABCMeta):
     """Base class for OpenSearch based modules."""
 
@@ -87,7 +110,7 @@ class BaseOpenSearch(AbstractModule, metaclass=abc.ABCMeta):
             "Connecting with user %s to OpenSearch %s.",
             *(auth.get("username"), self._url_string),
         )
-        self._connection = OpenSearch(**connection)
+        self._connection = OpenSearch(**connection, serializer=ORJSONSerializer())
 
         if conf["startup_ping"]:
             if not self._connection.ping():
@@ -216,7 +239,16 @@ class OpenSearchInput(BaseOpenSearch, AbstractInput):
             | base,
         )
 
-    def __call__(self, params: dict) -> list[dict]:
+    def __init__(self, *args):
+        super().__init__(*args)
+
+        # request bodies only depend on static task parameters, build them once.
+        # tasks only pass their params to calls, so it's kept under an internal key
+        for conf in self.task_confs:
+            conf["params"]["_body"] = self.build_body(conf["params"])
+
+    def build_body(self, params: dict) -> dict:
+        """Builds the search request body from the task parameters."""
         body = {"size": params["size"]}
         filters = []
 
@@ -249,9 +281,12 @@ class OpenSearchInput(BaseOpenSearch, AbstractInput):
         if filters:
             body["query"] = {"bool": {"filter": filters}}
 
+        return body
+
+    def __call__(self, params: dict) -> list[dict]:
         # pylint: disable=E1123
         raw_data = self._connection.search(
-            body=body,
+            body=params["_body"],
             index=params["index"],
             timeout=params["timeout"],
         )
@@ -315,29 +350,38 @@ class OpenSearchIndexMapping(BaseOpenSearch, AbstractTransform):
         }
 
     def __call__(self, data: "MetricFrame"):
+        settings = self.settings
 
-        defaults = self.settings["default_values"]
-        include_fields = self.settings["include_attributes"]
+        defaults = settings["default_values"]
+        include_fields = settings["include_attributes"]
+        key_field = settings["search_index_key"]
+        index = settings["search_index"]
+
+        encode_key = self.encoders.get(settings["key_encode"])
+        get_document = self._connection.get
 
         for metric in data:
-            key = metric[self.settings["search_index_key"]]
+            key = metric[key_field]
 
-            if encoding := self.settings["key_encode"]:
-                key = self.encoders[encoding](key)
+            if encode_key is not None:
+                key = encode_key(key)
 
             try:
-                response = self._connection.get(index=self.settings["search_index"], id=key)
-                document: dict = response["_source"]
+                document: dict = get_document(index=index, id=key)["_source"]
 
             except (NotFoundError, KeyError) as e:
-                if self.settings["fail_on_not_found"]:
+                if settings["fail_on_not_found"]:
                     raise e
                 document = {}
 
-            if include_fields is not None:
-                document = {key: document.get(key) or defaults.get(key) for key in include_fields}
+            if include_fields is None:
+                metric |= document
+                continue
 
-            metric |= document
+            # set the selected fields directly instead of merging a filtered copy
+            attributes = metric.attributes
+            for field in include_fields:
+                attributes[field] = document.get(field) or defaults.get(field)
 
 
 @Importable()
@@ -362,19 +406,23 @@ class OpenSearchOutput(BaseOpenSearch, AbstractOutput):
         }
 
     def __call__(self, data: "MetricFrame"):
-        if timestamp_field := self.settings["timestamp_field"]:
-            ts = data.creation_timestamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        index = self.settings["index"]
+        timestamp_field = self.settings["timestamp_field"]
+        ts = data.creation_timestamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
+        def actions():
+            # single lazy pass, the timestamp is set on the serialized copy of the frozen metric
             for metric in data:
-                metric[timestamp_field] = ts
+                source = metric.to_dict()
+                if timestamp_field:
+                    source[timestamp_field] = ts
 
-        index = self.settings["index"]
-        payload = [{"_index": index, "_source": dict(m)} for m in data]
+                yield {"_index": index, "_source": source}
 
         with self._write_lock:
             count, _ = bulk(
                 self._connection,
-                payload,
+                actions(),
                 request_timeout=self.settings["timeout"],
                 chunk_size=256,
             )
@@ -32,7 +32,7 @@ class OpenTelemetryABC(AbstractOutput, abc.ABC):
 
         self.producer = self.connection_config["producer"]
         self._session = requests.Session()
-        self._session.headers.update(self.connection_config["headers"] | {"Connection": "close"})
+        self._session.headers.update(self.connection_config["headers"])
 
         if auth := self.connection_config["auth"]:
             self._session.auth = (auth["username"], auth["password"])
@@ -41,7 +41,13 @@ class OpenTelemetryABC(AbstractOutput, abc.ABC):
         self.exporter = OTLPMetricExporter(
             endpoint=self.connection_config["endpoint"], session=self._session, **params
         )
-        self.reader = PeriodicExportingMetricReader(self.exporter)
+
+        # export in the background instead of blocking each call with a flush
+        reader_params = {}
+        if interval := self.settings["flush_timeout"]:
+            reader_params["export_interval_millis"] = interval * 1000
+
+        self.reader = PeriodicExportingMetricReader(self.exporter, **reader_params)
 
         self.provider = MeterProvider(
             metric_readers=[self.reader],
@@ -51,7 +57,9 @@ class OpenTelemetryABC(AbstractOutput, abc.ABC):
         self.instruments: dict[str, "Gauge"] = {}
 
     def on_shutdown(self) -> None:
-        self.exporter.force_flush()
+        if not self.provider.force_flush():
+            self.logger.warning("Failed to flush OpenTelemetry metrics.")
+
         self.exporter.shutdown()
         self._session.close()
 
@@ -60,27 +68,28 @@ class OpenTelemetryABC(AbstractOutput, abc.ABC):
     def __call__(self, data: "MetricFrame"):
         instrument_name = f"{self.producer}.{data.name}"
 
-        if not (instrument := self.instruments.get(instrument_name)):
+        if (instrument := self.instruments.get(instrument_name)) is None:
             instrument = self.meter.create_gauge(instrument_name)
             self.instruments[instrument_name] = instrument
 
+        static_attributes = self.settings["static_attributes"]
+        metric_field_name = self.settings["metric_field_name"]
+        set_gauge = instrument.set
+
         for metric in data:
-            attributes = metric.flatten() | self.settings["static_attributes"]
+            attributes = metric.flatten()
+            attributes.update(static_attributes)
 
-            if metric_field_name := self.settings["metric_field_name"]:
+            if metric_field_name:
                 attributes[metric_field_name] = metric.metric_field_name
 
-            instrument.set(metric.metric, attributes=attributes)
-
-        if timeout := self.settings["flush_timeout"]:
-            if not self.provider.force_flush(timeout * 1000):
-                self.logger.warning("Failed to flush OpenTelemetry metrics.")
+            set_gauge(metric.metric, attributes=attributes)
 
     @classmethod
     def params_schema(cls) -> dict:
         """
         :metric_field_name: Set a field to store the original metric's name. Included by default
-        :flush_timeout: Force flush all metrics after specified time
+        :flush_timeout: Export all metrics periodically after specified time
         :static_attributes: A set of additional attributes to be added
         """
         return {
@@ -1,5 +1,8 @@
 """This file contains modules for PostgreSQL requests."""
 
+from decimal import Decimal
+
+import orjson
 import simplejson as json
 from psycopg.rows import dict_row
 from psycopg_pool.pool import ConnectionPool
@@ -95,6 +98,23 @@ class PostgreSQL(AbstractInput):
                 cursor.execute(params["query"])
 
                 rows = cursor.fetchall()
-                json_results = json.loads(json.dumps(rows, use_decimal=True, default=str))
 
-        return json_results
+        # normalize database types (e.g. Decimal, datetime) into JSON types
+        try:
+            dumped = orjson.dumps(
+                rows, default=self._to_json, option=orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        # orjson rejects integers beyond 64 bit before calling `default`
+        except TypeError:
+            return json.loads(json.dumps(rows, use_decimal=True, default=str))
+
+        return orjson.loads(dumped)
+
+    @staticmethod
+    def _to_json(value):
+        """Converts values orjson cannot serialize natively."""
+        if isinstance(value, Decimal):
+            return float(value)
+        if isinstance(value, bytes):
+            return value.decode()
+        return str(value)
@@ -6,9 +6,14 @@ import sys
 import threading
 import typing
 from datetime import datetime
+from decimal import Decimal
+from itertools import takewhile
 from zoneinfo import ZoneInfo
 
+import orjson
 import simplejson as json
+from celery import states
+from celery.backends.base import BaseKeyValueStoreBackend
 from voluptuous import All, Any, Coerce, Lower, Maybe, Optional, Upper, ValueInvalid
 
 from core import Settings
@@ -17,8 +22,6 @@ from core.modules import Importable
 from core.task import States, StreamletTask
 
 if typing.TYPE_CHECKING:
-    from celery.result import AsyncResult
-
     from core.metric import MetricFrame
 
 
@@ -84,14 +87,17 @@ class StreamletMetrics(AbstractInput):
     def __call__(self, params: dict) -> list[dict]:
         current = datetime.now(ZoneInfo(Settings.timezone))
 
-        task_mapping = StreamletTask.LAST_TASK_IDS
-        task_ids = [t for d, t in task_mapping if d >= self.run_timestamp] + self.pending
+        # task ids are appended chronologically, only walk back to the last run
+        since = self.run_timestamp
+        # pylint: disable=E0111
+        recent = takewhile(lambda e: e[0] >= since, reversed(StreamletTask.LAST_TASK_IDS))
+        task_ids = [t for _, t in recent][::-1] + self.pending
 
         self.logger.debug("Fetching %d results from celery backend...", len(task_ids))
-        results: list["AsyncResult"] = [self.flow.AsyncResult(_id) for _id in task_ids]
+        metas = self._fetch_task_metas(task_ids)
 
-        self.pending = [r.task_id for r in results if r.state == "PENDING"]
-        results = [r for r in results if r not in self.pending]
+        self.pending = [t for t in task_ids if t not in metas]
+        results = list(metas.values())
 
         base = {
             "timestamp_from": self.run_timestamp.isoformat(),
@@ -99,17 +105,17 @@ class StreamletMetrics(AbstractInput):
         }
         dataset = [
             {
-                "metric": sum(1 for r in results if r.result == States.FINISHED),
+                "metric": sum(1 for r in results if r["result"] == States.FINISHED),
                 "streamlet_metric_type": "task_result",
                 "streamlet_result": "okay",
             },
             {
-                "metric": sum(1 for r in results if r.result == States.SKIPPED),
+                "metric": sum(1 for r in results if r["result"] == States.SKIPPED),
                 "streamlet_metric_type": "task_result",
                 "streamlet_result": "skipped",
             },
             {
-                "metric": sum(1 for r in results if r.state == "FAILURE"),
+                "metric": sum(1 for r in results if r["status"] == states.FAILURE),
                 "streamlet_metric_type": "task_result",
                 "streamlet_result": "failed",
             },
@@ -127,6 +133,17 @@ class StreamletMetrics(AbstractInput):
         self.run_timestamp = current
         return [r | base for r in dataset]
 
+    def _fetch_task_metas(self, task_ids: list[str]) -> dict[str, dict]:
+        """Fetches the metadata of all finished tasks, unfinished ones are left out."""
+        backend = self.flow.backend
+
+        # key-value backends like redis fetch all results in a single round-trip
+        if isinstance(backend, BaseKeyValueStoreBackend):
+            return dict(backend.get_many(task_ids, interval=0, max_iterations=1))
+
+        metas = {_id: backend.get_task_meta(_id) for _id in task_ids}
+        return {k: m for k, m in metas.items() if m["status"] in states.READY_STATES}
+
 
 @Importable()
 class ConsoleOutput(AbstractOutput):
@@ -149,13 +166,33 @@ class ConsoleOutput(AbstractOutput):
         }
 
     def __call__(self, data: "MetricFrame"):
+        width = self._width
+        write = self._pipe.write
+
         for metric in data:
-            out = json.dumps(dict(metric), ensure_ascii=False)
-            if self._width is not None:
-                out = out[: self._width - 3] + "..." if len(out) > self._width else out
+            out = self._dumps(metric.to_dict())
+            if width is not None:
+                out = out[: width - 3] + "..." if len(out) > width else out
+
+            write(f"{out}\n")
 
-            self._pipe.write(f"{out}\n")
-            self._pipe.flush()
+        self._pipe.flush()
+
+    @classmethod
+    def _dumps(cls, mapping: dict) -> str:
+        """Dumps a metric as compact JSON, accepting every type a validated metric may hold."""
+        try:
+            return orjson.dumps(mapping, default=cls._to_json).decode()
+        # orjson rejects integers beyond 64 bit before calling `default`
+        except TypeError:
+            return json.dumps(mapping, separators=(",", ":"))
+
+    @staticmethod
+    def _to_json(value):
+        """Converts values orjson cannot serialize natively, but metrics accept."""
+        if isinstance(value, Decimal):
+            return float(value)
+        raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
 
 
 @Importable()
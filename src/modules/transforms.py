@@ -1,10 +1,14 @@
 """Transform modules."""
 
+import ast
 import builtins
 import importlib
+import importlib.util
+import itertools
 import logging
 import operator
-import traceback
+import threading
+import types
 import typing
 from datetime import datetime
 
@@ -16,24 +20,44 @@ from core.modules import Importable
 from core.validation import AlwaysList
 
 if typing.TYPE_CHECKING:
-    from core.metric import MetricFrame
+    from core.metric import Metric, MetricFrame
 
 
 @Importable
-class CodeTransform(AbstractTransform):
+class CodeTransform(AbstractTransform):  # pylint: disable=R0902
     """Executes a Python code snippet on a Dataframe or Metric.
     Access it via `data` in the code."""
 
+    LOG_METHODS = ("print", "log_info", "log_warning", "log_error")
+
+    # code objects are immutable, share them between identical snippets
+    _compile_cache: dict[tuple[str, int], types.CodeType] = {}
+    _compile_lock = threading.Lock()
+
     def __init__(self, *args):
         super().__init__(*args)
 
         self.code = self.settings["src"]
+        self._code_lines = self.code.splitlines() if self.code else []
         self.iter_over_dataframe = self.settings["mode"] == "metric"
 
         self.allowed_builtins = self.settings["builtins"]
-        self.allowed_modules = {m: importlib.import_module(m) for m in self.settings["modules"]}
+        self.allowed_modules: dict | None = None
+
+        # modules are imported on the first call, only ensure they exist for now
+        for name in self.settings["modules"]:
+            if importlib.util.find_spec(name) is None:
+                raise ModuleNotFoundError(f"No module named '{name}'", name=name)
 
         self._binary = self.compile(self.code)
+        self._globals = self._allowed_globals()
+
+        # read-only snippets can't invalidate metrics, skip validating them afterward
+        self._mutates = self._binary is not None and self.may_mutate(self.code)
+
+        # single statements run as a plain function, bound to the globals on the first call
+        self._function_code = self.compile_function(self.code) if self._binary else None
+        self._function: types.FunctionType | None = None
 
     @classmethod
     def params_schema(cls) -> dict:
@@ -53,41 +77,87 @@ class CodeTransform(AbstractTransform):
         }
 
     def __call__(self, data: "MetricFrame"):
-        allowed_globals = self._allowed_globals()
+        if not self._binary:
+            return
+
+        if self.allowed_modules is None:
+            # build everything first and publish the modules last, other threads may call already
+            modules = {m: importlib.import_module(m) for m in self.settings["modules"]}
+            allowed_globals = self._allowed_globals(modules)
 
-        if self._binary:
-            access = data if self.iter_over_dataframe else [data]
-            for frame in access:
-                allowed_locals = {"data": frame}
+            if self._function_code is not None:
+                self._function = types.FunctionType(self._function_code, allowed_globals)
 
-                try:
-                    # pylint: disable=W0122
+            self._globals = allowed_globals
+            self.allowed_modules = modules
+
+        # pylint: disable=W0122
+        try:
+            if self._function is not None:
+                self._call_function(data)
+
+            elif self.iter_over_dataframe:
+                # shallow copy, so `global` statements can't leak between calls
+                allowed_globals = self._globals.copy()
+
+                # reuse one locals dict, cleared so variables don't leak between metrics
+                allowed_locals = {}
+                for metric in data:
+                    allowed_locals.clear()
+                    allowed_locals["data"] = metric
                     exec(self._binary, allowed_globals, allowed_locals)
-                except Exception as e:
-                    try:
-                        tbc = traceback.extract_tb(e.__traceback__)[-1]
-                        logging.error(
-                            "Encountered %s: %s\n[%s] %s\n   %s%s",
-                            e.__class__.__name__,
-                            str(e),
-                            tbc.lineno,
-                            self.code.splitlines()[tbc.lineno - 1],
-                            " " * (tbc.colno + len(str(tbc.lineno))),
-                            "^" * (tbc.end_colno - tbc.colno),
-                        )
-                    # pylint: disable=W0718
-                    except Exception as exc:
-                        logging.error(
-                            "[%s] Failed to generate code traceback: %s",
-                            *(exc.__class__.__name__, str(exc)),
-                        )
-                        logging.error("Original [%s]: %s", e.__class__.__name__, str(e))
-
-                    raise e
+            else:
+                exec(self._binary, self._globals.copy(), {"data": data})
+
+        except Exception as e:
+            self._log_exec_error(e)
+            raise e
 
+        if self._mutates:
             for metric in data:
                 metric.validate()
 
+    def _call_function(self, data: "MetricFrame"):
+        """Calls the snippet compiled as function, without the overhead of `exec`."""
+        function = self._function
+
+        if self.iter_over_dataframe:
+            for metric in data:
+                function(metric)
+        else:
+            function(data)
+
+    def _log_exec_error(self, e: Exception) -> None:
+        """Logs the snippet's line and position that raised the exception."""
+        try:
+            # walk to the innermost frame of the snippet itself, not of called code
+            snippet_tb, tb = None, e.__traceback__
+            while tb is not None:
+                if tb.tb_frame.f_code.co_filename == "<string>":
+                    snippet_tb = tb
+                tb = tb.tb_next
+
+            code = snippet_tb.tb_frame.f_code
+            lineno, _, colno, end_colno = next(
+                itertools.islice(code.co_positions(), snippet_tb.tb_lasti // 2, None)
+            )
+            logging.error(
+                "Encountered %s: %s\n[%s] %s\n   %s%s",
+                e.__class__.__name__,
+                str(e),
+                lineno,
+                self._code_lines[lineno - 1],
+                " " * (colno + len(str(lineno))),
+                "^" * (end_colno - colno),
+            )
+        # pylint: disable=W0718
+        except Exception as exc:
+            logging.error(
+                "[%s] Failed to generate code traceback: %s",
+                *(exc.__class__.__name__, str(exc)),
+            )
+            logging.error("Original [%s]: %s", e.__class__.__name__, str(e))
+
     def compile(self, code: str):
         """Compiles passed python code into a binary."""
         if code:
@@ -96,18 +166,74 @@ class CodeTransform(AbstractTransform):
                 self.logger.error(msg)
                 raise ValueError("Code execution not allowed.")
 
+            key = (code, self.settings["level"])
+            if (binary := self._compile_cache.get(key)) is not None:
+                return binary
+
             try:
-                return compile(code, "<string>", "exec", optimize=self.settings["level"])
+                binary = compile(code, "<string>", "exec", optimize=self.settings["level"])
 
             except SyntaxError as e:
                 self.logger.error("Syntax error while compiling: %s", (str(e)))
                 raise e
 
+            with self._compile_lock:
+                self._compile_cache[key] = binary
+
+            return binary
+
         return None
 
-    def _allowed_globals(self) -> dict:
+    def compile_function(self, code: str) -> types.CodeType | None:
+        """Compiles a single statement snippet into the code of a `_fn(data)` function.
+        Snippets binding names are excluded, as those would behave different inside functions."""
+        module = ast.parse(code)
+        if len(module.body) != 1 or not isinstance(
+            module.body[0], (ast.Assign, ast.AugAssign, ast.Expr)
+        ):
+            return None
+
+        if any(
+            isinstance(n, ast.Name) and not isinstance(n.ctx, ast.Load) for n in ast.walk(module)
+        ):
+            return None
+
+        function = ast.parse("def _fn(data): pass").body[0]
+        function.body = module.body
+        module.body = [ast.copy_location(function, module.body[0])]
+        ast.fix_missing_locations(module)
+
+        binary = compile(module, "<string>", "exec", optimize=self.settings["level"])
+        return next(c for c in binary.co_consts if isinstance(c, types.CodeType))
+
+    @classmethod
+    def may_mutate(cls, code: str) -> bool:
+        """Conservatively checks whether a snippet is able to change the data."""
+        for node in ast.walk(ast.parse(code)):
+            # augmented assignments mutate in place, e.g. `data |= {...}` or `data += [...]`
+            if isinstance(node, ast.AugAssign):
+                return True
+
+            # assignments and deletions of items or attributes, e.g. `data["x"] = 1`
+            if isinstance(node, (ast.Subscript, ast.Attribute)):
+                if not isinstance(node.ctx, ast.Load):
+                    return True
+
+            # rebinding or deleting `data` itself
+            elif isinstance(node, ast.Name) and node.id == "data":
+                if not isinstance(node.ctx, ast.Load):
+                    return True
+
+            # any call except logging might change its arguments, e.g. `data.append(...)`
+            elif isinstance(node, ast.Call):
+                if not (isinstance(node.func, ast.Name) and node.func.id in cls.LOG_METHODS):
+                    return True
+
+        return False
+
+    def _allowed_globals(self, modules: dict | None = None) -> dict:
         """Holds the list of allowed globals accessible with `exec`."""
-        modules = self.allowed_modules
+        modules = modules or {}
         ok_builtins = {n: getattr(builtins, n) for n in self.allowed_builtins}
         miscellaneous_methods = {
             "print": self.logger.info,
@@ -146,30 +272,56 @@ class KeyMapping(AbstractTransform):
         if self.settings["default"] is not None:
             self.settings["handle_missing"] = "default"
 
+        self._key_field = self.settings["key"]
+        self._result_field = self.settings["result_field"] or self._key_field
+        self._cast = self.TYPE_MAP.get(self.settings["cast_key"])
+        self._handle_missing = self._missing_handler(self.settings["handle_missing"])
+
     def __call__(self, data: "MetricFrame"):
-        key_field = self.settings["key"]
-        result_field = self.settings["result_field"] or key_field
-        cast = self.TYPE_MAP.get(self.settings["cast_key"], lambda t: t)
+        key_field, result_field = self._key_field, self._result_field
+        mapping, cast, handle_missing = self._mapping, self._cast, self._handle_missing
 
         for metric in data:
             try:
-                key = cast(metric[key_field])
+                key = metric[key_field]
             except KeyError as e:
                 self.logger.error("Key `%s` does not exist in Task `%s`.", key_field, data.name)
                 raise e
 
+            # builtin casts are identities on exact instances, only convert foreign types
+            if cast is not None and key.__class__ is not cast:
+                key = cast(key)
+
             try:
-                metric[result_field] = self._mapping[key]
+                metric[result_field] = mapping[key]
 
             except KeyError as e:
-                if (error_handler := self.settings["handle_missing"]) == "default":
-                    metric[result_field] = self.settings["default"]
-                elif error_handler == "original":
-                    metric[result_field] = metric[key_field]
-                elif error_handler == "original_casted":
-                    metric[result_field] = key
-                elif error_handler == "raise":
-                    raise e
+                handle_missing(metric, key, e)
+
+    def _missing_handler(self, mode: str) -> typing.Callable[["Metric", object, KeyError], None]:
+        """Resolves the configured mode of handling missing keys into a callable."""
+        key_field, result_field = self._key_field, self._result_field
+        default = self.settings["default"]
+
+        def set_default(metric, _key, _error):
+            metric[result_field] = default
+
+        def set_original(metric, _key, _error):
+            metric[result_field] = metric[key_field]
+
+        def set_original_casted(metric, key, _error):
+            metric[result_field] = key
+
+        def raise_error(_metric, _key, error):
+            raise error
+
+        handlers = {
+            "default": set_default,
+            "original": set_original,
+            "original_casted": set_original_casted,
+            "raise": raise_error,
+        }
+        return handlers.get(mode, lambda *_: None)
 
     @classmethod
     def params_schema(cls) -> dict:
@@ -199,7 +351,8 @@ class SimpleFilter(AbstractTransform):
     Define conditions in the format: `Condition` `Value` [`Data field`].
     Data gets excluded if all conditions are met.
 
-    Leave the data field empty for using metric as default field."""
+    Leave the data field empty for using metric as default field.
+    Boolean values match against `true` or `1`, everything else is false."""
 
     conditions = {
         "lt": operator.lt,
@@ -214,14 +367,10 @@ class SimpleFilter(AbstractTransform):
 
     def __init__(self, *args):
         super().__init__(*args)
-        self._cond, self._value, *self._data_field = self.settings["cond"].split(" ", maxsplit=2)
+        self._cond, self._value, *data_field = self.settings["cond"].split(" ", maxsplit=2)
+        self._data_field = data_field[0] if data_field else None
         self.mode = self.settings["mode"]
 
-        if len(self._data_field) == 0:
-            self._data_field = None
-        else:
-            self._data_field = self._data_field[0]
-
         try:
             self._cond = self.conditions[self._cond]
         except KeyError as e:
@@ -229,23 +378,70 @@ class SimpleFilter(AbstractTransform):
             self.logger.error("Condition %s is unknown, possible are: %s", self._cond, conditions)
             raise ValueError("Unknown condition for comparison.") from e
 
+        # pre-coerce the value for common metric types, others are coerced on first use
+        self._coerce_cache: dict[type, typing.Any] = {
+            str: self._value,
+            bool: self._value.lower() in ("true", "1"),
+        }
+        for value_type in (int, float):
+            try:
+                self._coerce_cache[value_type] = value_type(self._value)
+            except ValueError:
+                self._coerce_cache[value_type] = self._value
+
+        self._get_value = self._value_getter(self._data_field)
+
     def __call__(self, data: "MetricFrame"):
-        to_delete = []
-        for metric in data:
-            value = metric[self._data_field] if self._data_field else metric.metric
+        get_value, cond, coerce = self._get_value, self._cond, self._coerced
+        keep = self.mode == "keep"
 
-            try:
-                comp_value = type(value)(self._value)
-            except (ValueError, TypeError):
-                comp_value = self._value
+        values = list(map(get_value, data))
+
+        # homogeneous values are compared in one batch without a per-metric python loop
+        if len(value_types := set(map(type, values))) == 1:
+            matches = map(cond, values, itertools.repeat(coerce(value_types.pop())))
+            data[:] = itertools.compress(data, matches if keep else map(operator.not_, matches))
+            return
 
-            result = self._cond(value, comp_value)
-            if (self.mode == "keep" and result) or (self.mode == "drop" and not result):
-                continue
+        survivors = []
+        for metric, value in zip(data, values):
+            if bool(cond(value, coerce(type(value)))) is keep:
+                survivors.append(metric)
 
-            to_delete.append(id(metric))
+        data[:] = survivors
 
-        data[:] = [m for m in data.copy() if id(m) not in to_delete]
+    def _coerced(self, value_type: type) -> typing.Any:
+        """Returns the compared value coerced once per type of the metric values."""
+        try:
+            return self._coerce_cache[value_type]
+        except KeyError:
+            pass
+
+        try:
+            coerced = value_type(self._value)
+        except (ValueError, TypeError):
+            coerced = self._value
+
+        self._coerce_cache[value_type] = coerced
+        return coerced
+
+    @staticmethod
+    def _value_getter(field: str | None) -> typing.Callable[["Metric"], typing.Any]:
+        """Resolves the accessor for the compared value of a metric."""
+        if not field:
+            return operator.attrgetter("metric")
+
+        # nested fields need the path resolution of the metric
+        if Settings.nested_attr_seperator in field:
+            return operator.itemgetter(field)
+
+        # top level fields skip splitting and reducing the key on every metric
+        def get_value(metric: "Metric"):
+            if field == metric.metric_field_name:
+                return metric.metric
+            return metric.attributes[field]
+
+        return get_value
 
     @classmethod
     def params_schema(cls) -> dict:
@@ -1,3 +1,4 @@
+import importlib
 import logging
 from unittest.mock import patch
 
@@ -13,6 +14,14 @@ from core.task import StreamletTask
 from tests.fixtures.modules import DebugFlow
 
 REDIS_VERSIONS = ["8-alpine"]  # , "8-bookworm", "7"]
+MODULE_FILES = [
+    "src.modules.http",
+    "src.modules.monit",
+    "src.modules.opensearch",
+    "src.modules.postgresql",
+    "src.modules.streamlet",
+    "src.modules.transforms",
+]
 
 
 def run_streamlet(flow: DebugFlow):
@@ -41,6 +50,16 @@ def run_streamlet(flow: DebugFlow):
     return flow
 
 
+@pytest.fixture(scope="session", autouse=True)
+def warm_imports():
+    """Imports the module files and their SDKs once per session."""
+    for name in MODULE_FILES:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logging.info("Skipping warm import of %s, missing `%s`.", name, e.name)
+
+
 @pytest.fixture(params=REDIS_VERSIONS, scope="session")
 def broker(request):
     """Returns a broker for Streamlet"""
@@ -81,8 +100,33 @@ def task_states(request):
         pytest.fail(f"{DebugFlow.task_failed} Tasks failed (expected: {limit})")
 
 
+@pytest.fixture(scope="session")
+def module_registry():
+    """Returns a loader that initializes each module file once and restores it afterward."""
+    registries = (Modules.input_modules, Modules.transform_modules, Modules.output_modules)
+    snapshots: dict[str, tuple[dict, ...]] = {}
+
+    def load(file: str):
+        if file not in snapshots:
+            # initialize on empty registries, so the snapshot only holds this file's modules
+            backup = [registry.copy() for registry in registries]
+            for registry in registries:
+                registry.clear()
+
+            Modules.initialize(file=file)
+            snapshots[file] = tuple(registry.copy() for registry in registries)
+
+            for registry, modules in zip(registries, backup):
+                registry.update(modules)
+
+        for registry, modules in zip(registries, snapshots[file]):
+            registry.update(modules)
+
+    return load
+
+
 @pytest.fixture(scope="function")
-def streamlet(request, broker, reset_streamlet, task_states):
+def streamlet(request, broker, module_registry, reset_streamlet, task_states):
     """Returns a callable Flow instance with specifiable configuration."""
     # adjust default settings for testing
     Settings.run_once = True
@@ -94,9 +138,9 @@ def streamlet(request, broker, reset_streamlet, task_states):
     Settings.log_level = 10
 
     # load debug and optional modules
-    Modules.initialize(file="tests.fixtures.modules")
+    module_registry("tests.fixtures.modules")
     for module in request.param:
-        Modules.initialize(file=module)
+        module_registry(module)
 
     # configure broker
     redis_host, redis_port = broker.get_container_host_ip(), broker.get_exposed_port(broker.port)
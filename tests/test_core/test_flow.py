@@ -1,3 +1,4 @@
+import operator
 import re
 from importlib import metadata
 from unittest.mock import mock_open, patch
@@ -148,7 +149,7 @@ class TestFlow:
         run_streamlet(flow)
 
         frame: "MetricFrame" = flow.debug_output[0]
-        frame.sort(key=lambda x: x.metric_field_name)
+        frame.sort(key=operator.attrgetter("metric_field_name"))
 
         assert len(frame) == 4
 
@@ -94,3 +94,12 @@ class TestMetricAndData:
 
         expected = {"some_field": 123, "field": {"nested": 5, "nested2": 9}, "field2": "a"}
         assert metric.attributes == expected
+
+    def test_metric_to_dict(self):
+        Settings.nested_attr_seperator = "."
+        data = {"field": {"nested": 5}, "field2": "a"}
+        metric = Metric(self.get_frame(), data, 2, "metric")
+
+        expected = {"metric": 2, "field.nested": 5, "field2": "a"}
+        assert metric.to_dict() == expected
+        assert list(metric.to_dict()) == list(dict(metric))
@@ -1,7 +1,6 @@
 from datetime import datetime, timezone
 
 import pytest
-import simplejson as json
 from pytest_httpserver import httpserver as http
 
 from tests.fixtures.e2e import run_streamlet
@@ -40,23 +39,23 @@ class TestModuleMONIT:
         }
 
         cur_time = datetime.now(timezone.utc).replace(microsecond=0, second=0, minute=0, hour=0)
+        timestamp = cur_time.timestamp()
         expected = [
             {
                 "producer": "test_user",
                 "type": "task_name",
                 "type_prefix": "snw",
                 "environment": "dev",
-                "timestamp": cur_time.timestamp(),
+                "timestamp": timestamp,
                 "data": d,
             }
             for d in data
         ]
 
-        httpserver.expect_request(
-            "/test_user",
-            method="POST",
-            data=json.dumps(expected, sort_keys=True),
-        ).respond_with_json({"status": "ok"})
+        # compares the decoded body, independent of key order and formatting
+        httpserver.expect_request("/test_user", method="POST", json=expected).respond_with_json(
+            {"status": "ok"}
+        )
 
         flow = streamlet(configuration)
         run_streamlet(flow)
@@ -1,8 +1,10 @@
-import copy
 import logging
+import operator
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from opensearchpy import helpers
 from testcontainers.opensearch import OpenSearchContainer
 
 from core.metric import MetricFrame
@@ -12,42 +14,95 @@ from tests.fixtures.e2e import run_streamlet
 OPENSEARCH_VERSIONS = ["2", "3"] if FULL_TEST else ["2"]
 STREAMLET_MODULES = ["src.modules.opensearch"]
 
+get_metric = operator.attrgetter("metric")
+get_field_and_metric = operator.attrgetter("metric_field_name", "metric")
 
-@pytest.fixture(params=OPENSEARCH_VERSIONS, scope="class")
+
+# test indices need neither replicas nor periodic refreshes, they are refreshed explicitly
+INDEX_SETTINGS = {
+    "refresh_interval": "-1",
+    "number_of_replicas": 0,
+    "translog": {"durability": "async"},
+}
+
+# documents of the populated index, only timestamps are added when indexing
+BASE_DOCS = [
+    (
+        f"doc_{i + 1}",
+        {
+            "metric": i,
+            "field_1": ["a", "b", "c", "d", "e", "f", "g"][i % 7],
+            "field_2": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11][i % 11],
+            "metadata": {"host": f"pod_{i % 3}", "environment": "testing"},
+        },
+    )
+    for i in range(120)
+]
+
+# started containers by version, kept running until the session ends
+CONTAINERS: dict[str, OpenSearchContainer] = {}
+
+
+@pytest.fixture(params=OPENSEARCH_VERSIONS, scope="session")
 def database(request):
-    image = f"opensearchproject/opensearch:{request.param}"
-    with OpenSearchContainer(image, security_enabled=False) as db:
+    if request.param not in CONTAINERS:
+        image = f"opensearchproject/opensearch:{request.param}"
+        db = OpenSearchContainer(image, security_enabled=False).start()
+        request.session.addfinalizer(db.stop)
+
         logging.info("Using storage OpenSearch: %s", db.image)
-        yield db
+        CONTAINERS[request.param] = db
 
+    yield CONTAINERS[request.param]
 
-@pytest.fixture(scope="function")
+
+def recreate_index(client, index_name: str):
+    """Recreates an empty index, the container is shared by the whole session."""
+    client.indices.delete(index=index_name, ignore_unavailable=True)
+    client.indices.create(index=index_name, body={"settings": INDEX_SETTINGS})
+
+
+@pytest.fixture(scope="class")
 def populated_database(database):
     logging.info("Populating Database...")
 
     index_name = "testing_data"
 
     client = database.get_client()
-    client.indices.create(index=index_name)
-    client.indices.create(index="testing_results")
+    recreate_index(client, index_name)
 
     timestamp = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
 
-    for i in range(120):
-        doc = {
-            "timestamp": (timestamp - timedelta(minutes=(i + 10))).isoformat(),
-            "metric": i,
-            "field_1": ["a", "b", "c", "d", "e", "f", "g"][i % 7],
-            "field_2": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11][i % 11],
-            "metadata": {"host": f"pod_{i % 3}", "environment": "testing"},
+    actions = [
+        {
+            "_op_type": "index",
+            "_index": index_name,
+            "_id": doc_id,
+            "_source": {"timestamp": (timestamp - timedelta(minutes=(i + 10))).isoformat()} | doc,
         }
-        client.index(index=index_name, body=doc, id=f"doc_{i + 1}")
+        for i, (doc_id, doc) in enumerate(BASE_DOCS)
+    ]
+    # parallel_bulk is lazy, consuming it sends 4 chunks of 30 documents concurrently
+    for ok, info in helpers.parallel_bulk(client, actions, thread_count=4, chunk_size=30):
+        assert ok, info
+    client.indices.refresh(index=index_name)
 
     yield database
 
     logging.info("Dropping old indices")
     client.indices.delete(index=index_name)
-    client.indices.delete(index="testing_results")
+
+
+@pytest.fixture(scope="function")
+def results_index(populated_database):
+    index_name = "testing_results"
+
+    client = populated_database.get_client()
+    recreate_index(client, index_name)
+
+    yield index_name
+
+    client.indices.delete(index=index_name)
 
 
 def base_input_config(connection):
@@ -98,7 +153,7 @@ class TestModuleOpenSearch:
         frame: MetricFrame = flow.debug_output[0]
 
         expected_metrics = [x + 1 for x in range(120) if x % 3 == 0]
-        difference = [x - y for x, y in zip([m.metric for m in frame], expected_metrics)]
+        difference = [x - y for x, y in zip(map(get_metric, frame), expected_metrics)]
         assert all(d == difference[0] for d in difference)
 
     def test_read_lucene(self, streamlet, populated_database):
@@ -124,7 +179,7 @@ class TestModuleOpenSearch:
         frame: MetricFrame = flow.debug_output[0]
 
         expected_metrics = [x + 1 for x in range(120) if x % 3 == 0]
-        assert [m.metric for m in frame] == expected_metrics
+        assert list(map(get_metric, frame)) == expected_metrics
 
     def test_read_aggs(self, streamlet, populated_database):
         connection = populated_database.get_config()
@@ -153,13 +208,17 @@ class TestModuleOpenSearch:
 
         assert len(frame) == 2 * 7
 
+        by_field = defaultdict(list)
+        for field, metric in map(get_field_and_metric, frame):
+            by_field[field].append(metric)
+
         expected = [17, 17, 17, 17, 17, 17, 18]
         assert sum(expected) == 120
-        assert sorted([m.metric for m in frame if m.metric_field_name == "doc_count"]) == expected
+        assert sorted(by_field["doc_count"]) == expected
 
         expected = [969 + 17 * i for i in range(7)]
         assert sum(expected) == sum(i for i in range(120))
-        assert sorted([m.metric for m in frame if m.metric_field_name == "total"]) == expected
+        assert sorted(by_field["total"]) == expected
 
     def test_read_timeframe(self, streamlet, populated_database):
         connection = populated_database.get_config()
@@ -226,14 +285,15 @@ class TestModuleOpenSearch:
         frame: MetricFrame = flow.debug_output[0]
         assert len(frame) == 20
 
-        keys = ["env", "field_2", "index"]
-        assert all(sorted(m.attributes.keys()) == keys for m in frame)
-        assert all(m.metric == i for i, m in enumerate(frame))
+        keys = frozenset(["env", "field_2", "index"])
+        assert all(m.attributes.keys() == keys for m in frame)
+        assert list(map(get_metric, frame)) == list(range(len(frame)))
 
         expected = [[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11][i % 11] for i in range(len(frame))]
         assert [m["field_2"] for m in frame] == expected
 
-    def test_write(self, streamlet, populated_database):
+    @pytest.mark.parametrize("timestamp_field", [None, "ts"])
+    def test_write(self, streamlet, populated_database, results_index, timestamp_field):
         connection = base_input_config(populated_database.get_config())["input"][0]["connection"]
         payload = [{"metric": i, "index": f"doc_{i}", "env": "test"} for i in range(20)]
 
@@ -246,7 +306,7 @@ class TestModuleOpenSearch:
                         {
                             "name": "test_payload",
                             "cron": "* * * * *",
-                            "params": {"payload": copy.deepcopy(payload)},
+                            "params": {"payload": [dict(p) for p in payload]},
                         }
                     ],
                 }
@@ -255,7 +315,7 @@ class TestModuleOpenSearch:
                 {
                     "type": "opensearch",
                     "connection": connection,
-                    "params": {"index": "testing_results"},
+                    "params": {"index": results_index, "timestamp_field": timestamp_field},
                 }
             ],
         }
@@ -264,8 +324,14 @@ class TestModuleOpenSearch:
         run_streamlet(flow)
 
         client = populated_database.get_client()
-        request = client.search(index="testing_results", body={"size": 500})
+        client.indices.refresh(index=results_index)
+        request = client.search(index=results_index, body={"size": 500})
         inserted_entries = [r["_source"] for r in request["hits"]["hits"]]
 
         assert len(inserted_entries) == len(payload)
+
+        if timestamp_field is not None:
+            timestamps = [entry.pop(timestamp_field) for entry in inserted_entries]
+            assert all(datetime.strptime(t, "%Y-%m-%dT%H:%M:%S.%fZ") for t in timestamps)
+
         assert sorted(inserted_entries, key=lambda x: x["metric"]) == payload
@@ -1,4 +1,5 @@
 import logging
+from decimal import Decimal
 
 import psycopg
 import pytest
@@ -8,15 +9,47 @@ from tests import FULL_TEST
 from tests.fixtures.e2e import run_streamlet
 
 # Set these to the supported versions of https://dbod.web.cern.ch
-POSTGRESQL_VERSIONS = ["14.15", "15.10", "16.6"] if FULL_TEST else ["16.6"]
+# smoke runs use the lighter alpine image, the full matrix keeps the Debian images
+POSTGRESQL_VERSIONS = ["14.15", "15.10", "16.6"] if FULL_TEST else ["16-alpine"]
 STREAMLET_MODULES = ["src.modules.postgresql"]
 
 
-@pytest.fixture(params=POSTGRESQL_VERSIONS)
+# started containers by version, kept running until the session ends
+CONTAINERS: dict[str, PostgresContainer] = {}
+
+
+@pytest.fixture(params=POSTGRESQL_VERSIONS, scope="session")
 def database(request):
-    with PostgresContainer(f"postgres:{request.param}") as db:
+    if request.param not in CONTAINERS:
+        db = PostgresContainer(f"postgres:{request.param}").start()
+        request.session.addfinalizer(db.stop)
+
         logging.info("Using storage PostgreSQL: %s", db.image)
-        yield db
+        CONTAINERS[request.param] = db
+
+    yield CONTAINERS[request.param]
+
+
+def connect(database) -> tuple[dict, psycopg.Connection]:
+    """Returns the module connection config and a client for the database."""
+    conn = {
+        "dbname": database.dbname,
+        "auth": {"username": database.username, "password": database.username},
+        "host": database.get_container_host_ip(),
+        "port": database.get_exposed_port(database.port),
+    }
+
+    uri = f"postgresql://{conn["auth"]["username"]}:{conn["auth"]["password"]}@{conn["host"]}:{conn["port"]}/{conn["dbname"]}"
+    return conn, psycopg.connect(uri)
+
+
+def query_config(conn: dict, query: str) -> dict:
+    task = {"name": "simple_query", "cron": "* * * * *", "params": {"query": query}}
+    return {
+        "flow": {"version": "v1"},
+        "input": [{"type": "postgresql", "connection": conn, "tasks": [task]}],
+        "output": [{"type": "debug", "name": "debug"}],
+    }
 
 
 @pytest.mark.parametrize("streamlet", [STREAMLET_MODULES], indirect=True)
@@ -25,44 +58,20 @@ class TestModulePostgreSQL:
     def test_fetch_record(self, streamlet, database):
         """Fetch records from a table."""
 
-        conn = {
-            "dbname": database.dbname,
-            "auth": {"username": database.username, "password": database.username},
-            "host": database.get_container_host_ip(),
-            "port": database.get_exposed_port(database.port),
-        }
-
-        uri = f"postgresql://{conn["auth"]["username"]}:{conn["auth"]["password"]}@{conn["host"]}:{conn["port"]}/{conn["dbname"]}"
-        client: psycopg.Connection = psycopg.connect(uri)
+        conn, client = connect(database)
 
         logging.info("Filling DB with values")
+        client.execute("DROP TABLE IF EXISTS test")
         client.execute("CREATE TABLE test(number int, title text)")
 
         dummy_values = [(i, "title_a" if i % 3 else "title_b") for i in range(20)]
-        for pair in dummy_values:
-            client.execute("INSERT INTO test VALUES (%s, %s)", pair)
+        with client.cursor() as cur:
+            cur.executemany("INSERT INTO test VALUES (%s, %s)", dummy_values)
 
         client.commit()
 
-        configuration = {
-            "flow": {"version": "v1"},
-            "input": [
-                {
-                    "type": "postgresql",
-                    "connection": conn,
-                    "tasks": [
-                        {
-                            "name": "simple_query",
-                            "cron": "* * * * *",
-                            "params": {
-                                "query": "SELECT COUNT(*) as metric, title FROM test GROUP BY title"
-                            },
-                        }
-                    ],
-                }
-            ],
-            "output": [{"type": "debug", "name": "debug"}],
-        }
+        query = "SELECT COUNT(*) as metric, title FROM test GROUP BY title"
+        configuration = query_config(conn, query)
 
         expected = [{"metric": 13, "title": "title_a"}, {"metric": 7, "title": "title_b"}]
 
@@ -73,3 +82,18 @@ class TestModulePostgreSQL:
         dumped = sorted(dumped, key=lambda x: x["title"])
 
         assert expected == dumped
+
+    def test_fetch_types(self, streamlet, database):
+        """Fetch columns that have no native JSON type."""
+        conn, client = connect(database)
+
+        client.execute("DROP TABLE IF EXISTS types")
+        client.execute("CREATE TABLE types(amount numeric, raw bytea)")
+        client.execute("INSERT INTO types VALUES (%s, %s)", (Decimal("1.5"), b"abc"))
+        client.commit()
+
+        flow = streamlet(query_config(conn, "SELECT 1 as metric, amount, raw FROM types"))
+        run_streamlet(flow)
+
+        dumped = [{m.metric_field_name: m.metric} | m.flatten() for m in flow.debug_output[0]]
+        assert dumped == [{"metric": 1, "amount": 1.5, "raw": "abc"}]
@@ -1,18 +1,20 @@
-from time import sleep
+import io
+from decimal import Decimal
+from time import monotonic, sleep
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
+from celery import Celery
 
-from core.metric import MetricFrame
+from core.metric import Metric, MetricFrame
+from src.modules.streamlet import ConsoleOutput, StreamletMetrics
 from tests.fixtures.e2e import run_streamlet
 
 # Set these to the supported versions of https://dbod.web.cern.ch
 STREAMLET_MODULES = ["src.modules.streamlet"]
 
 
-def get_result(frame: MetricFrame, **filters):
-    return [m for m in frame if all(m.get(k) == v for k, v in filters.items())]
-
-
 @pytest.mark.parametrize("streamlet", [STREAMLET_MODULES], indirect=True)
 class TestModuleStreamlet:
     def test_shutdown_hook(self, streamlet):
@@ -33,22 +35,59 @@ class TestModuleStreamlet:
 
         flow = streamlet(configuration)
         run_streamlet(flow)
-        sleep(1)
+
+        # poll for the shutdown metrics instead of waiting a fixed time
+        deadline = monotonic() + 1.0
+        while len(flow.debug_output) < 2 and monotonic() < deadline:
+            sleep(0.01)
 
         assert len(flow.debug_output) == 2
         frame: MetricFrame = flow.debug_output[1]
 
-        task_count_ok = get_result(
-            frame, streamlet_metric_type="task_result", streamlet_result="okay"
-        )[0]
-        assert task_count_ok.metric == 1
+        results = {
+            m.get("streamlet_result"): m
+            for m in frame
+            if m.get("streamlet_metric_type") == "task_result"
+        }
+        assert results["okay"].metric == 1
+        assert results["skipped"].metric in [0, 1]
+        assert results["failed"].metric == 0
+
+
+class TestStreamletTaskMetas:
+    def test_redis_fetches_in_one_round_trip(self):
+        backend = Celery(backend="redis://localhost:6379/1").backend
+        module = SimpleNamespace(flow=SimpleNamespace(backend=backend))
+        task_ids = [f"task_{i}" for i in range(5)]
+
+        with (
+            patch.object(backend, "mget", return_value=[None] * 5) as mget,
+            patch.object(backend, "get_task_meta") as get_task_meta,
+        ):
+            metas = StreamletMetrics._fetch_task_metas(module, task_ids)
+
+        assert metas == {}
+        assert mget.call_count == 1
+        assert get_task_meta.call_count == 0
+
+
+class TestConsoleOutput:
+    def test_dump_json_types(self):
+        config = {
+            "connection": None,
+            "name": "console",
+            "modifiers": {},
+            "params": {"pipe": "stdout", "width": None},
+        }
+        output = ConsoleOutput(None, config, 0)
+        output._pipe = io.StringIO()
 
-        task_count_skipped = get_result(
-            frame, streamlet_metric_type="task_result", streamlet_result="skipped"
-        )[0]
-        assert task_count_skipped.metric in [0, 1]
+        frame = MetricFrame("test")
+        frame.append(Metric(frame, {"amount": Decimal("1.5")}, 1, "metric"))
+        frame.append(Metric(frame, {"big": 2**70}, 2, "metric"))
+        output(frame)
 
-        task_count_failed = get_result(
-            frame, streamlet_metric_type="task_result", streamlet_result="failed"
-        )[0]
-        assert task_count_failed.metric == 0
+        assert output._pipe.getvalue().splitlines() == [
+            '{"metric":1,"amount":1.5}',
+            '{"metric":2,"big":1180591620717411303424}',
+        ]
@@ -1,17 +1,32 @@
 import logging
+import operator
 
 import pytest
 
 from core import Settings
 from core.metric import MetricFrame
+from src.modules.transforms import CodeTransform
 from tests.fixtures.e2e import run_streamlet
 
 STREAMLET_MODULES = ["src.modules.transforms"]
 
+get_metric = operator.attrgetter("metric")
+
 
 @pytest.fixture()
 def payload():
-    return [{"name": {"letter": t}, "metric": i} for t, i in [("a", 1), ("b", 2), ("c", 3)]]
+    values = [("a", 1, False), ("b", 2, True), ("c", 3, False)]
+    return [{"name": {"letter": t}, "flag": f, "metric": i} for t, i, f in values]
+
+
+@pytest.fixture()
+def allow_exec(monkeypatch):
+    monkeypatch.setattr(Settings, "allow_exec", True)
+
+
+@pytest.fixture()
+def deny_exec(monkeypatch):
+    monkeypatch.setattr(Settings, "allow_exec", False)
 
 
 def config_payload(payload):
@@ -27,9 +42,7 @@ def config_payload(payload):
 class TestModuleCodeTransform:
 
     @pytest.mark.parametrize("check_logs", [(logging.CRITICAL,)], indirect=True)
-    def test_disabled_settings(self, streamlet, check_logs):
-        Settings.allow_exec = False
-
+    def test_disabled_settings(self, streamlet, check_logs, deny_exec):
         configuration = config_payload([])
         configuration["transform"] = [
             {
@@ -42,9 +55,7 @@ class TestModuleCodeTransform:
             streamlet(configuration)
 
     @pytest.mark.parametrize("check_logs", [(logging.CRITICAL,)], indirect=True)
-    def test_code_syntax_error(self, streamlet, check_logs):
-        Settings.allow_exec = True
-
+    def test_code_syntax_error(self, streamlet, check_logs, allow_exec):
         configuration = config_payload([])
         configuration["transform"] = [
             {
@@ -56,9 +67,7 @@ class TestModuleCodeTransform:
         with pytest.raises(SyntaxError):
             streamlet(configuration)
 
-    def test_run_code(self, streamlet, payload):
-        Settings.allow_exec = True
-
+    def test_run_code(self, streamlet, payload, allow_exec):
         configuration = config_payload(payload)
         configuration["transform"] = [
             {
@@ -75,10 +84,78 @@ class TestModuleCodeTransform:
         run_streamlet(flow)
 
         frame: MetricFrame = flow.debug_output[0]
-        assert sorted([m.metric for m in frame]) == [1, 2, 3]
+        assert sorted(map(get_metric, frame)) == [1, 2, 3]
         assert all(m["field"]["nested"] == 123 for m in frame)
         assert all(m["field.nested"] == 123 for m in frame)
 
+    def test_run_single_statement(self, streamlet, payload, allow_exec):
+        configuration = config_payload(payload)
+        configuration["transform"] = [
+            {
+                "type": "codetransform",
+                "params": {"builtins": "int", "src": "data['x'] = int('1')", "mode": "metric"},
+            }
+        ]
+
+        flow = streamlet(configuration)
+        run_streamlet(flow)
+
+        frame: MetricFrame = flow.debug_output[0]
+        assert sorted(map(get_metric, frame)) == [1, 2, 3]
+        assert all(m["x"] == 1 for m in frame)
+
+    def test_run_single_statement_module(self, streamlet, payload, allow_exec):
+        configuration = config_payload(payload)
+        configuration["transform"] = [
+            {
+                "type": "codetransform",
+                "params": {
+                    "modules": "math",
+                    "src": "data['x'] = math.floor(data.metric / 2)",
+                    "mode": "metric",
+                },
+            }
+        ]
+
+        flow = streamlet(configuration)
+        run_streamlet(flow)
+
+        frame: MetricFrame = flow.debug_output[0]
+        assert [m["x"] for m in frame] == [0, 1, 1]
+
+    @pytest.mark.parametrize("check_logs", [(logging.CRITICAL,)], indirect=True)
+    @pytest.mark.parametrize("task_states", [{"passed": 0, "failed": 1}], indirect=True)
+    def test_validate_augmented_assignment(self, streamlet, payload, allow_exec):
+        configuration = config_payload(payload)
+        configuration["transform"] = [
+            {
+                "type": "codetransform",
+                "params": {"src": "data |= {'x': {1, 2}}", "mode": "metric"},
+            }
+        ]
+
+        flow = streamlet(configuration)
+        run_streamlet(flow)
+
+        assert flow.debug_output == []
+
+
+class TestCodeTransformMutation:
+    @pytest.mark.parametrize(
+        "src,mutates",
+        [
+            ("print(data)\nlog_info(data['name'])", False),
+            ("value = data.metric", False),
+            ("data['x'] = 1", True),
+            ("data |= {'x': 1}", True),
+            ("data += []", True),
+            ("del data", True),
+            ("data.update({})", True),
+        ],
+    )
+    def test_may_mutate(self, src, mutates):
+        assert CodeTransform.may_mutate(src) is mutates
+
 
 @pytest.mark.parametrize("streamlet", [STREAMLET_MODULES], indirect=True)
 class TestModuleKeyMapper:
@@ -99,7 +176,7 @@ class TestModuleKeyMapper:
         run_streamlet(flow)
 
         frame: MetricFrame = flow.debug_output[0]
-        assert [m.metric for m in frame] == ["hello", "world", "unknown"]
+        assert list(map(get_metric, frame)) == ["hello", "world", "unknown"]
         assert [m["name.letter"] for m in frame] == ["a", "b", "c"]
 
     @pytest.mark.parametrize("check_logs", [(logging.CRITICAL,)], indirect=True)
@@ -119,30 +196,30 @@ class TestModuleKeyMapper:
         assert flow.debug_output == []
 
 
+FILTER_CASES = {
+    "keep_then_drop": (
+        [{"cond": "gt 1", "mode": "keep"}, {"cond": "gt 2", "mode": "drop"}],
+        [2],
+    ),
+    "keep_equal": ([{"cond": "eq 2", "mode": "keep"}], [2]),
+    "drop_nested_field": ([{"cond": "eq b name.letter", "mode": "drop"}], [1, 3]),
+    "keep_metric_field": ([{"cond": "le 2 metric", "mode": "keep"}], [1, 2]),
+    "keep_bool_true": ([{"cond": "eq true flag", "mode": "keep"}], [2]),
+    "keep_bool_false": ([{"cond": "eq false flag", "mode": "keep"}], [1, 3]),
+}
+
+
 @pytest.mark.parametrize("streamlet", [STREAMLET_MODULES], indirect=True)
 class TestModuleSimpleFilter:
-    def test_conditions_keep(self, streamlet, payload):
+    @pytest.mark.parametrize(
+        "filters,expected", list(FILTER_CASES.values()), ids=list(FILTER_CASES.keys())
+    )
+    def test_conditions(self, streamlet, payload, filters, expected):
         configuration = config_payload(payload)
-        configuration["transform"] = [
-            {
-                "type": "simplefilter",
-                "params": {
-                    "cond": "gt 1",
-                    "mode": "keep",
-                },
-            },
-            {
-                "type": "simplefilter",
-                "params": {
-                    "cond": "gt 2",
-                    "mode": "drop",
-                },
-            },
-        ]
+        configuration["transform"] = [{"type": "simplefilter", "params": f} for f in filters]
 
         flow = streamlet(configuration)
         run_streamlet(flow)
 
         frame: MetricFrame = flow.debug_output[0]
-        assert len(frame) == 1
-        assert [m.metric for m in frame] == [2]
+        assert list(map(get_metric, frame)) == expected